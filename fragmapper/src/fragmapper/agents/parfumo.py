@@ -8,11 +8,12 @@ Output-Contract: 1.1.0
 Last-Updated: 2026-01-10
 """
 
-from typing import Any, Optional
+import functools
+from collections.abc import Iterable
+from typing import Any, ClassVar, NamedTuple, Optional
 
 from fragmapper.agents.base import BaseAgent
 from fragmapper.models.schemas import (
-    AlternateMatch,
     DebugInfo,
     InputSummary,
     MapperOutput,
@@ -22,6 +23,14 @@ from fragmapper.models.schemas import (
 from fragmapper.utils.normalizer import TextNormalizer
 
 
+class _Clues(NamedTuple):
+    """Immutable result of clue extraction, safe to share from a cache."""
+
+    normalized: str
+    excluded: tuple[str, ...]
+    input_summary: InputSummary
+
+
 class ParfumoMapper(BaseAgent):
     """
     ParfumoMapper - Maps messy fragrance descriptions to Parfumo.com URLs.
@@ -42,10 +51,26 @@ class ParfumoMapper(BaseAgent):
     VERSION = "1.1.0"
     MODE = Mode.DESC_TO_PARFUMO_URL
 
+    # Max number of distinct input texts whose extracted clues are memoized
+    CLUE_CACHE_SIZE = 4096
+
+    # Max number of distinct normalized titles whose summaries are memoized
+    SUMMARY_CACHE_SIZE = 10_000
+
+    # Excluded inputs are never matched, so their components are not extracted
+    _EXCLUDED_SUMMARY: ClassVar[InputSummary] = InputSummary()
+
+    # Parfumo slugs replace spaces and apostrophes with underscores
+    _URL_TRANSLATE = str.maketrans({" ": "_", "'": "_"})
+
     def __init__(self, config: Optional[dict[str, Any]] = None):
         """Initialize ParfumoMapper with config."""
         super().__init__(config)
         self.normalizer = TextNormalizer(config)
+        self._scan_clues_cached = functools.lru_cache(maxsize=self.CLUE_CACHE_SIZE)(
+            self._scan_clues
+        )
+        self._summaries_by_normalized: dict[str, InputSummary] = {}
 
     def execute(self, input_text: str) -> MapperOutput:
         """
@@ -66,6 +91,30 @@ class ParfumoMapper(BaseAgent):
         # Step 1: Normalize & Extract Clues
         input_summary, debug_info = self._extract_clues(input_text)
 
+        # Step 2-4: Search, Score, and Determine Confidence
+        return self._resolve(input_summary, debug_info)
+
+    def execute_many(self, inputs: Iterable[str]) -> list[MapperOutput]:
+        """
+        Execute the Parfumo mapping workflow over a batch of inputs.
+
+        Clues are extracted for the whole batch first, then resolved, so
+        repeated descriptions share extraction work and the search step
+        can later be batched across all inputs at once.
+
+        Args:
+            inputs: Free-text fragrance descriptions; any iterable, consumed once
+
+        Returns:
+            One MapperOutput per input, in input order
+        """
+        extract_clues = self._extract_clues
+        resolve = self._resolve
+        clues = [extract_clues(input_text) for input_text in inputs]
+        return [resolve(input_summary, debug_info) for input_summary, debug_info in clues]
+
+    def _resolve(self, input_summary: InputSummary, debug_info: DebugInfo) -> MapperOutput:
+        """Turn extracted clues into a result, honoring exclusions first."""
         # Check for exclusions
         if debug_info.excluded_terms_found:
             return MapperOutput(
@@ -76,15 +125,13 @@ class ParfumoMapper(BaseAgent):
                 notes=["Input contains exclusion terms"],
             )
 
-        # Step 2-4: Search, Score, and Determine Confidence
         # NOTE: This is a placeholder implementation.
         # In production, this would integrate with:
         # - Web search API (to search site:parfumo.com)
         # - Or LLM with web browsing capability
         # - Or a pre-built Parfumo database
 
-        result = self._search_and_match(input_summary, debug_info)
-        return result
+        return self._search_and_match(input_summary, debug_info)
 
     def _extract_clues(
         self, input_text: str
@@ -101,29 +148,61 @@ class ParfumoMapper(BaseAgent):
         - Target (men/women/unisex)
         - Key notes
         - Bottle cues
+
+        Results are memoized per input text. The frozen InputSummary is
+        shared between calls, while DebugInfo is mutable and built fresh so
+        callers never share state. Models are built with their regular
+        constructors: pydantic-core validation is cheaper than
+        model_construct, which inspects every omitted default_factory in
+        Python on each call.
         """
-        normalized = self.normalizer.normalize(input_text)
-        excluded = self.normalizer.find_exclusions(input_text)
-
-        # Extract components using normalizer
-        components = self.normalizer.extract_components(input_text)
-
-        input_summary = InputSummary(
-            brand=components.get("brand"),
-            name=components.get("name"),
-            concentration=components.get("concentration"),
-            size_ml=components.get("size_ml"),
-            flanker=components.get("flanker"),
-            year=components.get("year"),
-            target=components.get("target"),
-        )
+        clues = self._scan_clues_cached(input_text)
 
         debug_info = DebugInfo(
-            normalized_title=normalized,
-            excluded_terms_found=excluded,
+            normalized_title=clues.normalized,
+            excluded_terms_found=list(clues.excluded),
         )
 
-        return input_summary, debug_info
+        return clues.input_summary, debug_info
+
+    def _scan_clues(self, input_text: str) -> _Clues:
+        """
+        Run the normalizer passes over the input text.
+
+        Components come from the normalized title, and summaries are
+        memoized on it, so near-duplicates that differ only in case,
+        spacing, punctuation, or noise terms share one InputSummary.
+        Excluded inputs skip extraction entirely.
+        """
+        analyzed = self.normalizer.analyze(input_text)
+        normalized = analyzed.normalized
+
+        summaries = self._summaries_by_normalized
+        if analyzed.exclusions:
+            input_summary = self._EXCLUDED_SUMMARY
+        elif normalized in summaries:
+            input_summary = summaries[normalized]
+        else:
+            components = analyzed.components
+            input_summary = InputSummary(
+                brand=components.get("brand"),
+                name=components.get("name"),
+                concentration=components.get("concentration"),
+                size_ml=components.get("size_ml"),
+                flanker=components.get("flanker"),
+                year=components.get("year"),
+                target=components.get("target"),
+            )
+            if len(summaries) >= self.SUMMARY_CACHE_SIZE:
+                # Evict the oldest entry; dicts preserve insertion order
+                del summaries[next(iter(summaries))]
+            summaries[normalized] = input_summary
+
+        return _Clues(
+            normalized=normalized,
+            excluded=analyzed.exclusions,
+            input_summary=input_summary,
+        )
 
     def _search_and_match(
         self, input_summary: InputSummary, debug_info: DebugInfo
@@ -161,6 +240,9 @@ class ParfumoMapper(BaseAgent):
         # 1. Execute web search
         # 2. Parse results
         # 3. Score candidates
+        #    Keep per-feature scores (brand, name, flanker, concentration) as
+        #    parallel arrays and combine them with one weighted sum; select the
+        #    top 5 by partial sort and only build AlternateMatch models for those
         # 4. Return best match or AMBIGUOUS
 
         # For now, return NOT_FOUND as this requires external integration
@@ -187,7 +269,7 @@ class ParfumoMapper(BaseAgent):
             Parfumo URL
         """
         # Parfumo URL pattern: https://www.parfumo.com/Perfumes/{Brand}/{Name}
-        # Spaces are replaced with underscores
-        brand_slug = brand.replace(" ", "_")
-        name_slug = name.replace(" ", "_")
-        return f"https://www.parfumo.com/Perfumes/{brand_slug}/{name_slug}"
+        # Spaces and apostrophes are replaced with underscores in one pass
+        # over both path segments
+        path = f"{brand}/{name}".translate(self._URL_TRANSLATE)
+        return f"https://www.parfumo.com/Perfumes/{path}"
@@ -10,16 +10,31 @@ Usage:
     fragmapper --list-modes
 """
 
-import argparse
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, cast
 
 from fragmapper.router import FragMapperRouter
-from fragmapper.models.schemas import Mode
+from fragmapper.models.schemas import MapperOutput, Mode
 
+if TYPE_CHECKING:
+    import argparse
 
-def create_parser() -> argparse.ArgumentParser:
+# Mode choices, computed once instead of per invocation
+_MODE_CHOICES = tuple(m.value for m in Mode)
+
+# The enum's own value -> member index; a plain dict lookup, no EnumMeta.__call__
+_MODES_BY_VALUE: dict[str, Mode] = cast("dict[str, Mode]", Mode._value2member_map_)
+
+# Bare single-flag invocations answered without building the argparse parser
+_VERSION_FLAGS = ("-v", "--version")
+_LIST_MODES_FLAGS = ("-l", "--list-modes")
+
+
+def create_parser() -> "argparse.ArgumentParser":
     """Create the argument parser."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="fragmapper",
         description="Map fragrance descriptions to canonical database URLs.",
@@ -48,7 +63,7 @@ Examples:
     parser.add_argument(
         "--mode", "-m",
         type=str,
-        choices=[m.value for m in Mode],
+        choices=_MODE_CHOICES,
         help="The mode to execute (e.g., DESC_TO_PARFUMO_URL)",
     )
 
@@ -73,36 +88,89 @@ Examples:
     return parser
 
 
+def _print_modes() -> int:
+    """Print all supported modes."""
+    print("Supported modes:")
+    for mode in Mode:
+        print(f"  {mode.value}")
+    return 0
+
+
+def _print_version(router: FragMapperRouter) -> int:
+    """Print version information for the router, config, and skills."""
+    version_info = router.get_version_info()
+    print(f"FragMapper v{version_info['router']}")
+    print(f"Config version: {version_info['config_version']}")
+    for key, value in version_info.items():
+        if key.startswith("skill_"):
+            skill_name = key.replace("skill_", "")
+            print(f"  {skill_name}: v{value}")
+    return 0
+
+
+def _build_router(config_path: Path | None = None) -> FragMapperRouter | None:
+    """Create the router, reporting failures on stderr."""
+    try:
+        return FragMapperRouter(config_path=config_path)
+    except Exception as e:
+        print(f"Error initializing router: {e}", file=sys.stderr)
+        return None
+
+
+def _write_json(result: MapperOutput) -> None:
+    """Write the full JSON response, using orjson when it is installed."""
+    # orjson produces bytes, so it needs a binary stream under sys.stdout;
+    # text-only streams (e.g. io.StringIO) take the pydantic path
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        try:
+            import orjson
+        except ImportError:
+            pass
+        else:
+            sys.stdout.flush()
+            buffer.write(
+                orjson.dumps(
+                    result.model_dump(mode="json"),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+                )
+            )
+            return
+
+    print(result.model_dump_json(indent=2))
+
+
 def main() -> int:
     """Main CLI entrypoint."""
+    # Fast paths: skip argparse entirely for a bare --list-modes / --version
+    argv = sys.argv[1:]
+    if len(argv) == 1:
+        if argv[0] in _LIST_MODES_FLAGS:
+            return _print_modes()
+        if argv[0] in _VERSION_FLAGS:
+            router = _build_router()
+            return _print_version(router) if router else 1
+
     parser = create_parser()
     args = parser.parse_args()
 
+    # A plain --list-modes needs no router; with --version or --config the
+    # router is built first, so version wins and config errors are reported
+    if args.list_modes and not (args.version or args.config):
+        return _print_modes()
+
     # Initialize router
-    config_path = Path(args.config) if args.config else None
-    try:
-        router = FragMapperRouter(config_path=config_path)
-    except Exception as e:
-        print(f"Error initializing router: {e}", file=sys.stderr)
+    router = _build_router(Path(args.config) if args.config else None)
+    if router is None:
         return 1
 
     # Handle --version
     if args.version:
-        version_info = router.get_version_info()
-        print(f"FragMapper v{version_info['router']}")
-        print(f"Config version: {version_info['config_version']}")
-        for key, value in version_info.items():
-            if key.startswith("skill_"):
-                skill_name = key.replace("skill_", "")
-                print(f"  {skill_name}: v{value}")
-        return 0
+        return _print_version(router)
 
     # Handle --list-modes
     if args.list_modes:
-        print("Supported modes:")
-        for mode in router.supported_modes:
-            print(f"  {mode.value}")
-        return 0
+        return _print_modes()
 
     # Validate required arguments for processing
     if not args.mode:
@@ -112,11 +180,11 @@ def main() -> int:
 
     # Process input
     try:
-        mode = Mode(args.mode)
+        mode = _MODES_BY_VALUE[args.mode]
         result = router.route(mode, args.input)
 
         if args.json:
-            print(result.model_dump_json(indent=2))
+            _write_json(result)
         else:
             print(result.to_simple_output())
 
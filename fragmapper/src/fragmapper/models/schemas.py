@@ -8,7 +8,7 @@ Last-Updated: 2026-01-10
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field
 
 
 class Mode(str, Enum):
@@ -31,6 +31,8 @@ class MatchStatus(str, Enum):
 class AlternateMatch(BaseModel):
     """An alternate candidate match."""
 
+    model_config = {"frozen": True}
+
     url: str = Field(..., description="Candidate URL")
     confidence: float = Field(
         ..., ge=0.0, le=1.0, description="Confidence score between 0 and 1"
@@ -41,6 +43,8 @@ class AlternateMatch(BaseModel):
 class InputSummary(BaseModel):
     """Extracted/normalized input information."""
 
+    model_config = {"frozen": True}
+
     brand: Optional[str] = Field(None, description="Brand/house name")
     name: Optional[str] = Field(None, description="Fragrance name (core name)")
     concentration: Optional[str] = Field(
@@ -113,11 +117,14 @@ class MapperOutput(BaseModel):
             - "AMBIGUOUS" + URLs for AMBIGUOUS
             - "NOT_FOUND" for NO_MATCH or EXCLUDED
         """
-        if self.status == MatchStatus.MATCH and self.primary_url:
+        status = self.status
+        # Most results (placeholders, exclusions, misses) are not found
+        if status is MatchStatus.NO_MATCH or status is MatchStatus.EXCLUDED:
+            return "NOT_FOUND"
+        elif status is MatchStatus.MATCH and self.primary_url:
             return self.primary_url
-        elif self.status == MatchStatus.AMBIGUOUS and self.alternates:
-            urls = [alt.url for alt in self.alternates]
-            return "AMBIGUOUS\n" + "\n".join(urls)
+        elif status is MatchStatus.AMBIGUOUS and self.alternates:
+            return "AMBIGUOUS\n" + "\n".join(alt.url for alt in self.alternates)
         else:
             return "NOT_FOUND"
 
@@ -14,23 +14,40 @@ Non-negotiables:
     - Do not add any output beyond what the selected skill's output contract allows
 """
 
+import copy
+import functools
+import importlib
+from collections.abc import Callable
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional, cast
 
-import yaml
-
-from fragmapper.agents.parfumo import ParfumoMapper
-from fragmapper.agents.fragrantica import FragranticaMapper
-from fragmapper.agents.crosswalk import CrosswalkMapper
-from fragmapper.agents.base import BaseAgent
 from fragmapper.models.schemas import (
     Mode,
     MapperOutput,
     MatchStatus,
     RouterInput,
-    RulesConfig,
 )
 
+if TYPE_CHECKING:
+    from fragmapper.agents.base import BaseAgent
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_config(path: Path, mtime_ns: int) -> dict[str, Any]:
+    """
+    Parse a rules config file.
+
+    Cached per (path, mtime), so routers built repeatedly against the same
+    file parse it only once, while edits are picked up. The cached dict is
+    never handed out directly; callers receive a deep copy.
+    """
+    import yaml
+
+    # Prefer the libyaml C loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader) or {}
+
 
 class FragMapperRouter:
     """
@@ -47,6 +64,13 @@ class FragMapperRouter:
     VERSION = "1.1.0"
     LAST_UPDATED = "2026-01-10"
 
+    # Skill class for each mode as "module:Class", imported on first use
+    SKILL_PATHS: dict[Mode, str] = {
+        Mode.DESC_TO_PARFUMO_URL: "fragmapper.agents.parfumo:ParfumoMapper",
+        Mode.DESC_TO_FRAGRANTICA_URL: "fragmapper.agents.fragrantica:FragranticaMapper",
+        Mode.PARFUMO_TO_FRAGRANTICA_URL: "fragmapper.agents.crosswalk:CrosswalkMapper",
+    }
+
     def __init__(self, config_path: Optional[Path] = None):
         """
         Initialize the router with optional config path.
@@ -56,7 +80,9 @@ class FragMapperRouter:
         """
         self.config_path = config_path or self._get_default_config_path()
         self.config = self._load_config()
-        self._skills = self._initialize_skills()
+        self._skills: dict[Mode, BaseAgent] = {}
+        # Bound execute methods per mode, so route() is a single dict lookup
+        self._dispatch: dict[Mode, Callable[[str], MapperOutput]] = {}
 
     def _get_default_config_path(self) -> Path:
         """Get the default config file path."""
@@ -64,20 +90,33 @@ class FragMapperRouter:
         package_root = Path(__file__).parent.parent.parent.parent
         return package_root / "configs" / "fragmapper_rules.yml"
 
-    def _load_config(self) -> dict:
+    def _load_config(self) -> dict[str, Any]:
         """Load rules configuration from YAML file."""
-        if self.config_path.exists():
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
-        return {}
-
-    def _initialize_skills(self) -> dict[Mode, BaseAgent]:
-        """Initialize skill modules for each mode."""
-        return {
-            Mode.DESC_TO_PARFUMO_URL: ParfumoMapper(config=self.config),
-            Mode.DESC_TO_FRAGRANTICA_URL: FragranticaMapper(config=self.config),
-            Mode.PARFUMO_TO_FRAGRANTICA_URL: CrosswalkMapper(config=self.config),
-        }
+        # A single stat both checks the file exists and supplies the cache key
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+        except OSError:
+            return {}
+
+        # Each router gets its own copy, so mutating one router's config
+        # cannot leak into the cached parse or other routers
+        return copy.deepcopy(_parse_config(self.config_path.absolute(), mtime_ns))
+
+    def _get_skill_class(self, mode: Mode) -> type["BaseAgent"]:
+        """Import and return the skill class for a mode in SKILL_PATHS."""
+        module_name, _, class_name = self.SKILL_PATHS[mode].partition(":")
+        skill_class = getattr(importlib.import_module(module_name), class_name)
+        return cast("type[BaseAgent]", skill_class)
+
+    def _get_skill(self, mode: Mode) -> Optional["BaseAgent"]:
+        """Return the skill for a mode, initializing it on first access."""
+        skill = self._skills.get(mode)
+        if skill is None:
+            if mode not in self.SKILL_PATHS:
+                return None
+            skill_class = self._get_skill_class(mode)
+            skill = self._skills[mode] = skill_class(config=self.config)
+        return skill
 
     def route(self, mode: Mode, input_text: str) -> MapperOutput:
         """
@@ -90,17 +129,21 @@ class FragMapperRouter:
         Returns:
             MapperOutput with the result
         """
-        skill = self._skills.get(mode)
+        execute = self._dispatch.get(mode)
 
-        if skill is None:
-            # If MODE is missing or unsupported, return NOT_FOUND
-            return MapperOutput(
-                mode=mode,
-                status=MatchStatus.NO_MATCH,
-                notes=["Unsupported MODE"],
-            )
+        if execute is None:
+            skill = self._get_skill(mode)
+
+            if skill is None:
+                # If MODE is missing or unsupported, return NOT_FOUND
+                return MapperOutput(
+                    mode=mode,
+                    status=MatchStatus.NO_MATCH,
+                    notes=["Unsupported MODE"],
+                )
+            execute = self._dispatch[mode] = skill.execute
 
-        return skill.execute(input_text)
+        return execute(input_text)
 
     def process(self, router_input: RouterInput) -> MapperOutput:
         """
@@ -131,7 +174,7 @@ class FragMapperRouter:
     @property
     def supported_modes(self) -> list[Mode]:
         """Return list of supported modes."""
-        return list(self._skills.keys())
+        return list(self.SKILL_PATHS)
 
     def get_version_info(self) -> dict[str, str]:
         """Return version information for all components."""
@@ -140,7 +183,7 @@ class FragMapperRouter:
             "router_last_updated": self.LAST_UPDATED,
             "config_version": self.config.get("version", "unknown"),
             **{
-                f"skill_{mode.value}": skill.VERSION
-                for mode, skill in self._skills.items()
+                f"skill_{mode.value}": self._get_skill_class(mode).VERSION
+                for mode in self.SKILL_PATHS
             },
         }
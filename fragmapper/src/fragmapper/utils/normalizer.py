@@ -5,8 +5,142 @@ Version: 1.0.0
 Last-Updated: 2026-01-10
 """
 
+import functools
 import re
-from typing import Any, Optional
+import sys
+from collections.abc import Iterable
+from typing import Any, NamedTuple, Optional, TypeAlias
+
+# Character trie: each key is one character of a term ("" marks a term end)
+_Trie: TypeAlias = dict[str, "_Trie"]
+
+
+def _literal_trie_pattern(terms: Iterable[str], flexible_spaces: bool = False) -> str:
+    """
+    Build a prefix-factored regex that matches any of the literal terms.
+
+    Terms sharing a prefix share one branch ("absolu" and "absolute" become
+    "absolu(?:te)?"), so each text position is tested against a trie rather
+    than against every term in turn. The longest matching term wins. With
+    flexible_spaces, a space in a term matches any run of whitespace.
+    """
+    trie: _Trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}  # End-of-term marker
+
+    def build(node: _Trie) -> str:
+        branches = [
+            (r"\s+" if flexible_spaces and char == " " else re.escape(char)) + build(child)
+            for char, child in node.items()
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie) or r"(?!)"
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_exclusions(terms: tuple[str, ...]) -> re.Pattern[str]:
+    """
+    Compile the exclusion pattern for a set of lowercase terms.
+
+    Cached on the terms, so normalizers sharing a config (or the defaults)
+    share one compiled pattern. Matches whole words only (plurals allowed),
+    so "mini" does not fire inside "administrator"; the edges are lookarounds
+    rather than \\b, so terms that start or end with punctuation, such as
+    "(used)", still match. Trie-shaped, so overlapping terms prefer the
+    longer match. The group captures the configured term itself.
+    """
+    return re.compile(rf"(?<!\w)({_literal_trie_pattern(terms)})s?(?!\w)")
+
+
+def _compile_components(
+    concentration_terms: dict[str, str], flanker_terms: list[str]
+) -> tuple[re.Pattern[str], dict[str, tuple[str, int, Any]]]:
+    """
+    Fuse all component patterns into a single alternation.
+
+    Each alternative is wrapped in its own named group, mapped to
+    (component, priority, value); being outermost, that group is what
+    ``match.lastgroup`` reports. Within a component, a lower priority
+    wins regardless of where it occurs in the text, matching the
+    first-pattern-wins order of the individual pattern lists. Size and
+    target priority come from the matched inner group (ml before oz;
+    men, women, unisex); concentration and flanker priority is per
+    matched term, looked up in the group's value.
+    """
+    # Concentrations rank in order of first appearance of their value, so
+    # every synonym of EDP outranks every synonym of EDT, and so on
+    concentration_ranks = {
+        v: rank for rank, v in enumerate(dict.fromkeys(concentration_terms.values()))
+    }
+    # Order only matters where two alternatives can match at the same
+    # position: size must precede year, so "1990 ml" is a size. Reordering
+    # by token frequency was measured and makes no difference, since most
+    # positions fail every alternative on their first character.
+    alternatives: list[tuple[str, str, Any]] = [
+        # Concentration synonyms share one trie-shaped group, so the longest
+        # synonym at a position wins ("extrait de parfum" over "extrait").
+        # Spaces match any whitespace run; the value is keyed on the term
+        # with single spaces.
+        (
+            "concentration",
+            rf"\b(?:{_literal_trie_pattern(concentration_terms, flexible_spaces=True)})\b",
+            {t: (concentration_ranks[v], v) for t, v in concentration_terms.items()},
+        ),
+        # One size alternative; the unit group that matched sets its priority
+        (
+            "size_ml",
+            r"(?P<size>\d+(?:\.\d+)?)\s*(?:(?P<ml>ml|milliliter)|(?P<oz>oz|ounce|fl\.?\s*oz))",
+            None,
+        ),
+        ("year", r"\b(?:19\d{2}|20\d{2})\b", None),
+        # One target alternative; the audience group that matched sets its
+        # priority
+        (
+            "target",
+            r"\b(?:(?P<men>pour\s+homme|for\s+men|men'?s?)"
+            r"|(?P<women>pour\s+femme|for\s+women|women'?s?)"
+            r"|(?P<unisex>unisex))\b",
+            ("men", "women", "unisex"),
+        ),
+        # Flanker terms go last and match whole words only, so "oud" does not
+        # fire inside "cloud". They share one trie-shaped group whose value
+        # maps each term to its priority and display value; display values
+        # are interned so every normalizer shares one string each.
+        (
+            "flanker",
+            rf"\b(?:{_literal_trie_pattern(t.lower() for t in flanker_terms)})\b",
+            {t.lower(): (rank, sys.intern(t.title())) for rank, t in enumerate(flanker_terms)},
+        ),
+    ]
+
+    groups: dict[str, tuple[str, int, Any]] = {}
+    ranks: dict[str, int] = {}
+    parts = []
+    for index, (component, pattern, value) in enumerate(alternatives):
+        name = f"c{index}"
+        rank = ranks.get(component, 0)
+        ranks[component] = rank + 1
+        groups[name] = (component, rank, value)
+        parts.append(f"(?P<{name}>{pattern})")
+
+    return re.compile("|".join(parts)), groups
+
+
+class AnalyzedText(NamedTuple):
+    """Result of TextNormalizer.analyze, derived from one lowercase copy."""
+
+    lower: str
+    normalized: str
+    exclusions: tuple[str, ...]
+    components: dict[str, Any]
 
 
 class TextNormalizer:
@@ -20,12 +154,20 @@ class TextNormalizer:
     - Pack/size parsing (100 ml, 3.4 oz, "set", "2x")
     """
 
-    # Concentration synonyms and mappings
-    CONCENTRATION_PATTERNS = {
-        r"\b(edp|eau\s+de\s+parfum)\b": "EDP",
-        r"\b(edt|eau\s+de\s+toilette)\b": "EDT",
-        r"\b(edc|eau\s+de\s+cologne|cologne)\b": "EDC",
-        r"\b(parfum|extrait|extrait\s+de\s+parfum|pure\s+parfum)\b": "Parfum",
+    # Concentration synonyms and mappings (whole words; spaces match any
+    # whitespace run). Earlier concentrations win when several are present.
+    CONCENTRATION_TERMS = {
+        "edp": "EDP",
+        "eau de parfum": "EDP",
+        "edt": "EDT",
+        "eau de toilette": "EDT",
+        "edc": "EDC",
+        "eau de cologne": "EDC",
+        "cologne": "EDC",
+        "parfum": "Parfum",
+        "extrait": "Parfum",
+        "extrait de parfum": "Parfum",
+        "pure parfum": "Parfum",
     }
 
     # Default exclusion terms
@@ -42,17 +184,18 @@ class TextNormalizer:
         "refill",
     ]
 
-    # Noise terms to remove
+    # Noise terms to remove (whole words; spaces match any whitespace run)
     NOISE_TERMS = [
-        r"\b(spray)\b",
-        r"\b(authentic)\b",
-        r"\b(100%)\b",
-        r"\b(genuine)\b",
-        r"\b(original)\b",
-        r"\b(new\s+in\s+box|nib)\b",
-        r"\b(sealed)\b",
-        r"\b(brand\s+new)\b",
-        r"\b(free\s+shipping)\b",
+        "spray",
+        "authentic",
+        "100%",
+        "genuine",
+        "original",
+        "new in box",
+        "nib",
+        "sealed",
+        "brand new",
+        "free shipping",
     ]
 
     # Size patterns
@@ -80,15 +223,79 @@ class TextNormalizer:
         "exclusive",
     ]
 
+    # Long forms replaced by canonical short forms (whole words, any case;
+    # spaces match any whitespace run)
+    CANONICAL_TERMS = {
+        "eau de parfum": "EDP",
+        "eau de toilette": "EDT",
+        "eau de cologne": "EDC",
+        "pour homme": "for men",
+        "pour femme": "for women",
+    }
+
+    # Template for extract_components results, copied per call
+    _EMPTY_COMPONENTS: dict[str, Any] = {
+        "brand": None,
+        "name": None,
+        "concentration": None,
+        "size_ml": None,
+        "flanker": None,
+        "year": None,
+        "target": None,
+    }
+
+    # Max number of distinct lowercased texts memoized by each cached pass
+    CACHE_SIZE = 8192
+
+    # Compiled once at class load and shared by every instance. These stay on
+    # stdlib re: listing titles are short, and a linear-time engine such as
+    # RE2 loses more to per-call binding overhead than it saves in matching.
+    # Every pattern runs on lowercased text, so none needs re.IGNORECASE.
+    _NOISE_RE = re.compile(rf"\b(?:{_literal_trie_pattern(NOISE_TERMS, flexible_spaces=True)})\b")
+    _NONWORD_RE = re.compile(r"[^\w\s\-\./]")
+    # The same character class as _NONWORD_RE, restricted to ASCII, as a
+    # bytes table: bytes.translate is a flat lookup, str.translate a dict one
+    _ASCII_NONWORD = bytes(
+        c for c in range(128) if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in "_-./")
+    )
+    _ASCII_NONWORD_TABLE = bytes.maketrans(_ASCII_NONWORD, b" " * len(_ASCII_NONWORD))
+    _COMPONENTS_RE, _COMPONENT_GROUPS = _compile_components(
+        CONCENTRATION_TERMS, FLANKER_TERMS
+    )
+    # Runs on raw text to preserve its casing, so this one is case-insensitive
+    _CANONICAL_RE = re.compile(
+        rf"\b(?:{_literal_trie_pattern(CANONICAL_TERMS, flexible_spaces=True)})\b",
+        re.IGNORECASE,
+    )
+
+    # Bound pattern methods for the per-input hot path
+    _noise_sub = _NOISE_RE.sub
+    _nonword_sub = _NONWORD_RE.sub
+    _components_finditer = _COMPONENTS_RE.finditer
+
     def __init__(self, config: Optional[dict[str, Any]] = None):
         """
         Initialize the normalizer with optional config.
 
+        Only the exclusion pattern depends on config; it is compiled once
+        per distinct set of exclusion terms.
+
         Args:
             config: Configuration dictionary that may contain custom rules
         """
         self.config = config or {}
         self.exclusions = self._load_exclusions()
+        self._exclusion_terms = tuple(sorted(set(self.exclusions)))
+        self._exclusion_re = _compile_exclusions(self._exclusion_terms)
+        self._normalize_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(
+            self._normalize_lower
+        )
+        self._find_exclusions_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(
+            self._find_exclusions_lower
+        )
+        self._extract_components_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(
+            self._extract_components_lower
+        )
 
     def _load_exclusions(self) -> list[str]:
         """Load exclusion terms from config or use defaults."""
@@ -100,47 +307,112 @@ class TextNormalizer:
         """
         Normalize input text for matching.
 
+        Results are memoized per lowercased text.
+
         Args:
             text: Raw input text
 
         Returns:
             Normalized text
         """
-        result = text.lower()
-
-        # Remove noise terms
-        for pattern in self.NOISE_TERMS:
-            result = re.sub(pattern, "", result, flags=re.IGNORECASE)
-
-        # Remove emojis and special characters
-        result = re.sub(r"[^\w\s\-\./]", " ", result)
+        return self._normalize_cached(text.lower())
+
+    def _normalize_lower(self, result: str) -> str:
+        """Normalize text that has already been lowercased."""
+        # Remove noise terms in a single pass
+        result = self._noise_sub("", result)
+
+        # Remove emojis and special characters. ASCII text (the common case)
+        # takes one linear table pass over its bytes, cheap enough to run
+        # unconditionally; other text needs the Unicode-aware regex, which
+        # plain alphanumeric titles can skip.
+        if result.isascii():
+            result = result.encode("ascii").translate(self._ASCII_NONWORD_TABLE).decode("ascii")
+        elif not result.replace(" ", "").isalnum():
+            result = self._nonword_sub(" ", result)
+
+        # Collapse multiple spaces and trim
+        return " ".join(result.split())
+
+    def normalize_many(self, texts: Iterable[str]) -> list[str]:
+        """
+        Normalize a batch of input texts.
 
-        # Collapse multiple spaces
-        result = re.sub(r"\s+", " ", result).strip()
+        Listing batches repeat titles heavily, so each distinct text is
+        normalized only once.
 
-        return result
+        Args:
+            texts: Raw input texts
 
-    def find_exclusions(self, text: str) -> list[str]:
+        Returns:
+            Normalized texts, in input order
+        """
+        normalize_cached = self._normalize_cached
+        seen: dict[str, str] = {}
+        results = []
+        for text in texts:
+            result = seen.get(text)
+            if result is None:
+                result = seen[text] = normalize_cached(text.lower())
+            results.append(result)
+        return results
+
+    def find_exclusions(self, text: str) -> tuple[str, ...]:
         """
         Find exclusion terms in the text.
 
+        Results are memoized per lowercased text; being tuples, they are
+        safe to share between callers.
+
         Args:
             text: Input text to check
 
         Returns:
-            List of exclusion terms found
+            Tuple of exclusion terms found, in order of first appearance
+        """
+        return self._find_exclusions_cached(text.lower())
+
+    def _find_exclusions_lower(self, text_lower: str) -> tuple[str, ...]:
+        """Find exclusion terms in text that has already been lowercased."""
+        # Every match contains its term as a substring, so plain substring
+        # checks cheaply clear the common case of a text with no exclusions.
+        if not any(term in text_lower for term in self._exclusion_terms):
+            return ()
+        return tuple(dict.fromkeys(self._exclusion_re.findall(text_lower)))
+
+    def analyze(self, text: str) -> AnalyzedText:
+        """
+        Run every normalizer pass over the text from one lowercase copy.
+
+        Exclusions are found in the lowercased text and components in the
+        normalized one. Excluded inputs are rejected regardless of their
+        components, so extraction is skipped for them and every component
+        is None.
+
+        Args:
+            text: Input text
+
+        Returns:
+            AnalyzedText with the lowercased and normalized text, the
+            exclusion terms found, and the extracted components
         """
         text_lower = text.lower()
-        found = []
-        for exclusion in self.exclusions:
-            if exclusion in text_lower:
-                found.append(exclusion)
-        return found
+        normalized = self._normalize_cached(text_lower)
+        exclusions = self._find_exclusions_cached(text_lower)
+        if exclusions:
+            components = self._EMPTY_COMPONENTS.copy()
+        else:
+            components = self._extract_components_cached(normalized).copy()
+        return AnalyzedText(text_lower, normalized, exclusions, components)
 
     def extract_components(self, text: str) -> dict[str, Any]:
         """
         Extract fragrance components from text.
 
+        All components are found in a single scan of the fused pattern.
+        Results are memoized per lowercased text, and each call returns
+        its own copy.
+
         Args:
             text: Input text
 
@@ -154,47 +426,64 @@ class TextNormalizer:
             - year
             - target
         """
-        components: dict[str, Any] = {
-            "brand": None,
-            "name": None,
-            "concentration": None,
-            "size_ml": None,
-            "flanker": None,
-            "year": None,
-            "target": None,
-        }
+        return self._extract_components_cached(text.lower()).copy()
 
-        text_lower = text.lower()
+    def extract_components_many(self, texts: Iterable[str]) -> list[dict[str, Any]]:
+        """
+        Extract fragrance components from a batch of input texts.
+
+        Each distinct text is scanned only once (and memoized, as in
+        extract_components); every text gets its own copy of the result, so
+        callers may modify them independently.
+
+        Args:
+            texts: Input texts
 
-        # Extract concentration
-        for pattern, concentration in self.CONCENTRATION_PATTERNS.items():
-            if re.search(pattern, text_lower):
-                components["concentration"] = concentration
-                break
-
-        # Extract size
-        size_ml = self._extract_size_ml(text)
-        if size_ml:
-            components["size_ml"] = size_ml
-
-        # Extract year (4-digit number between 1900-2100)
-        year_match = re.search(r"\b(19\d{2}|20\d{2})\b", text)
-        if year_match:
-            components["year"] = int(year_match.group(1))
-
-        # Extract target
-        if re.search(r"\b(pour\s+homme|for\s+men|men'?s?)\b", text_lower):
-            components["target"] = "men"
-        elif re.search(r"\b(pour\s+femme|for\s+women|women'?s?)\b", text_lower):
-            components["target"] = "women"
-        elif re.search(r"\b(unisex)\b", text_lower):
-            components["target"] = "unisex"
-
-        # Extract flanker terms
-        for flanker in self.FLANKER_TERMS:
-            if flanker.lower() in text_lower:
-                components["flanker"] = flanker.title()
-                break
+        Returns:
+            Component dictionaries, in input order
+        """
+        extract_cached = self._extract_components_cached
+        seen: dict[str, dict[str, Any]] = {}
+        results = []
+        for text in texts:
+            components = seen.get(text)
+            if components is None:
+                components = seen[text] = extract_cached(text.lower())
+            results.append(components.copy())
+        return results
+
+    def _extract_components_lower(self, text_lower: str) -> dict[str, Any]:
+        """Extract components from text that has already been lowercased."""
+        components = self._EMPTY_COMPONENTS.copy()
+        ranks: dict[str, int] = {}
+        groups = self._COMPONENT_GROUPS
+
+        for match in self._components_finditer(text_lower):
+            # Every alternative is a named group, so a match always has one
+            assert match.lastgroup is not None
+            component, rank, value = groups[match.lastgroup]
+            if component == "concentration":
+                term = match.group()
+                rank, value = value.get(term) or value[" ".join(term.split())]
+            elif component == "flanker":
+                rank, value = value[match.group()]
+            elif component == "size_ml":
+                rank = 0 if match.group("ml") else 1
+            elif component == "target":
+                rank = 0 if match.group("men") else 1 if match.group("women") else 2
+                value = value[rank]
+            if ranks.get(component, rank + 1) <= rank:
+                continue
+            ranks[component] = rank
+
+            if component == "size_ml":
+                size = float(match.group("size"))
+                if rank:
+                    size *= 29.5735  # Convert oz to ml
+                value = int(size) or None
+            elif component == "year":
+                value = int(match.group())
+            components[component] = value
 
         # Note: Brand and Name extraction would typically require
         # a database lookup or more sophisticated NLP.
@@ -202,30 +491,24 @@ class TextNormalizer:
 
         return components
 
-    def _extract_size_ml(self, text: str) -> Optional[int]:
+    def canonicalize(self, text: str) -> str:
         """
-        Extract size in milliliters from text.
+        Replace long-form terms with their canonical short forms.
+
+        All terms are replaced in a single pass ("Sauvage Eau de Parfum pour
+        homme" becomes "Sauvage EDP for men"); the rest of the text is left
+        as is.
 
         Args:
             text: Input text
 
         Returns:
-            Size in ml, or None if not found
+            Text with canonical terms
         """
-        text_lower = text.lower()
-
-        # Try ml patterns first
-        ml_match = re.search(r"(\d+(?:\.\d+)?)\s*(ml|milliliter)", text_lower)
-        if ml_match:
-            return int(float(ml_match.group(1)))
-
-        # Try oz patterns and convert to ml
-        oz_match = re.search(r"(\d+(?:\.\d+)?)\s*(oz|ounce|fl\.?\s*oz)", text_lower)
-        if oz_match:
-            oz_value = float(oz_match.group(1))
-            return int(oz_value * 29.5735)  # Convert oz to ml
-
-        return None
+        canonical = self.CANONICAL_TERMS
+        return self._CANONICAL_RE.sub(
+            lambda match: canonical[" ".join(match.group().lower().split())], text
+        )
 
     def build_search_query(
         self,
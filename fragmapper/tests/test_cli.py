@@ -0,0 +1,149 @@
+"""
+Tests for the FragMapper CLI.
+
+Version: 1.0.0
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from fragmapper import cli
+from fragmapper.models.schemas import (
+    AlternateMatch,
+    DebugInfo,
+    InputSummary,
+    MapperOutput,
+    MatchStatus,
+    Mode,
+)
+
+
+def run_cli(monkeypatch: pytest.MonkeyPatch, *argv: str) -> int:
+    """Run the CLI entrypoint with the given arguments."""
+    monkeypatch.setattr(sys, "argv", ["fragmapper", *argv])
+    return cli.main()
+
+
+class TestFlagPrecedence:
+    """Test how --version, --list-modes and --config combine."""
+
+    def test_list_modes(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ):
+        """Test --list-modes prints every supported mode."""
+        assert run_cli(monkeypatch, "--list-modes", "--json") == 0
+        out = capsys.readouterr().out
+        assert out.startswith("Supported modes:")
+        assert "DESC_TO_PARFUMO_URL" in out
+
+    def test_version_wins_over_list_modes(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ):
+        """Test --version is handled before --list-modes."""
+        assert run_cli(monkeypatch, "--version", "--list-modes") == 0
+        out = capsys.readouterr().out
+        assert out.startswith("FragMapper v")
+        assert "Supported modes:" not in out
+
+    def test_list_modes_reports_broken_config(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        tmp_path: Path,
+    ):
+        """Test --list-modes with an unreadable config fails like other commands."""
+        config = tmp_path / "broken.yml"
+        config.write_text("global: [unclosed\n", encoding="utf-8")
+        assert run_cli(monkeypatch, "--list-modes", "--config", str(config)) == 1
+        assert "Error initializing router" in capsys.readouterr().err
+
+
+class TestSingleFlagFastPaths:
+    """Test that a bare -l/-v is answered without building the argparse parser."""
+
+    @pytest.fixture(autouse=True)
+    def no_parser(self, monkeypatch: pytest.MonkeyPatch):
+        """Fail the test if the argparse parser is built."""
+
+        def fail() -> None:
+            raise AssertionError("argparse parser was built")
+
+        monkeypatch.setattr(cli, "create_parser", fail)
+
+    @pytest.mark.parametrize("flag", ["-l", "--list-modes"])
+    def test_list_modes_flag(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], flag: str
+    ):
+        """Test a bare list-modes flag prints every mode."""
+        assert run_cli(monkeypatch, flag) == 0
+        out = capsys.readouterr().out
+        assert out.startswith("Supported modes:")
+        for mode in Mode:
+            assert f"  {mode.value}\n" in out
+
+    @pytest.mark.parametrize("flag", ["-v", "--version"])
+    def test_version_flag(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], flag: str
+    ):
+        """Test a bare version flag prints router and skill versions."""
+        assert run_cli(monkeypatch, flag) == 0
+        out = capsys.readouterr().out
+        assert out.startswith("FragMapper v")
+        assert "Config version:" in out
+        assert "  DESC_TO_PARFUMO_URL: v" in out
+
+
+class TestJsonOutput:
+    """Test the --json writer on binary and text-only streams."""
+
+    @pytest.fixture
+    def result(self) -> MapperOutput:
+        """Create a result exercising nested models, floats and non-ASCII text."""
+        return MapperOutput(
+            mode=Mode.DESC_TO_PARFUMO_URL,
+            input_summary=InputSummary(brand="Hermès", name="Terre d'Hermès", size_ml=100),
+            status=MatchStatus.AMBIGUOUS,
+            confidence=0.5,
+            alternates=[
+                AlternateMatch(url="https://www.parfumo.com/Perfumes/Hermes/a", confidence=1.0),
+                AlternateMatch(url="https://www.parfumo.com/Perfumes/Hermes/b", confidence=0.3333),
+            ],
+            notes=['Quoted "note"'],
+            debug=DebugInfo(search_queries_used=["hermès terre"]),
+        )
+
+    def write(self, monkeypatch: pytest.MonkeyPatch, stream: io.TextIOBase, result) -> None:
+        """Run _write_json with sys.stdout replaced by the given stream."""
+        monkeypatch.setattr(sys, "stdout", stream)
+        cli._write_json(result)
+        stream.flush()
+
+    def test_text_only_stream_uses_pydantic(
+        self, monkeypatch: pytest.MonkeyPatch, result: MapperOutput
+    ):
+        """Test a stream without a binary buffer gets the pydantic JSON."""
+        stream = io.StringIO()
+        self.write(monkeypatch, stream, result)
+        assert stream.getvalue() == result.model_dump_json(indent=2) + "\n"
+
+    def test_orjson_and_pydantic_output_match(
+        self, monkeypatch: pytest.MonkeyPatch, result: MapperOutput
+    ):
+        """Test the orjson path writes the same JSON text as the pydantic path."""
+        pytest.importorskip("orjson")
+        binary = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        self.write(monkeypatch, binary, result)
+        orjson_text = binary.buffer.getvalue().decode("utf-8")
+
+        # Without orjson, the same binary-backed stream takes the pydantic path
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        fallback = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        self.write(monkeypatch, fallback, result)
+        fallback_text = fallback.buffer.getvalue().decode("utf-8")
+
+        assert orjson_text == fallback_text
+        assert json.loads(orjson_text) == result.model_dump(mode="json")
@@ -42,6 +42,52 @@ class TestParfumoMapper:
         assert result.status == MatchStatus.EXCLUDED
         assert len(result.debug.excluded_terms_found) >= 2
 
+    def test_execute_many_matches_execute(self, mapper: ParfumoMapper):
+        """Test that batch execution matches per-input execution."""
+        inputs = ["Dior Sauvage EDP 100ml", "Chanel Bleu sample", "Dior Sauvage EDP 100ml"]
+        results = mapper.execute_many(inputs)
+        assert len(results) == len(inputs)
+        for input_text, result in zip(inputs, results):
+            assert result == mapper.execute(input_text)
+
+    def test_execute_many_accepts_any_iterable(self, mapper: ParfumoMapper):
+        """Test that batch execution consumes generators as well as lists."""
+        inputs = ["Dior Sauvage EDP 100ml", "Chanel Bleu sample"]
+        assert mapper.execute_many(text for text in inputs) == mapper.execute_many(inputs)
+
+    @pytest.mark.parametrize(
+        ("input_text", "concentration", "size_ml"),
+        [
+            ("Dior Sauvage 3.4oz", None, 100),
+            ("Dior Sauvage 3.4 fl. oz.", None, 100),
+            ("Creed Aventus 100ml/3.3oz", None, 100),
+            ("Dior Sauvage EDP 100ML!!", "EDP", 100),
+            ("Dior Sauvage Eau de Parfum (100 ml)", "EDP", 100),
+            ("Chanel Bleu Eau de Parfum, 100ml", "EDP", 100),
+            ("Armani Code Pour Homme - EDT - 3.4oz", "EDT", 100),
+            ("Chanel Allure Homme Sport Eau Extreme EDP 3.4 Fl.Oz", "EDP", 100),
+            ("Dior Sauvage Eau-de-Parfum", "Parfum", None),
+            ("Versace Eros E.D.T 100ml", None, 100),
+        ],
+    )
+    def test_punctuated_components_match_raw_extraction(
+        self, mapper: ParfumoMapper, input_text: str, concentration, size_ml
+    ):
+        """Test components from the normalized title match the raw-text extraction."""
+        input_summary = mapper.execute(input_text).input_summary
+        assert input_summary.concentration == concentration
+        assert input_summary.size_ml == size_ml
+        components = mapper.normalizer.extract_components(input_text)
+        assert components["concentration"] == concentration
+        assert components["size_ml"] == size_ml
+
+    def test_noise_inside_a_component_is_skipped(self, mapper: ParfumoMapper):
+        """Test noise terms removed before extraction no longer split a component."""
+        input_text = "Chanel Bleu EDP 100 authentic ml"
+        assert mapper.execute(input_text).input_summary.size_ml == 100
+        # The raw text, as extracted before normalization, has no size
+        assert mapper.normalizer.extract_components(input_text)["size_ml"] is None
+
 
 class TestTextNormalizer:
     """Test suite for TextNormalizer utility."""
@@ -58,12 +104,71 @@ class TestTextNormalizer:
         assert "authentic" not in result.lower()
         assert "new in box" not in result.lower()
 
+    def test_patterns_are_compiled_once(self, normalizer: TextNormalizer):
+        """Test normalizers with the same exclusion terms share compiled patterns."""
+        reordered = {"global": {"exclusions": list(reversed(TextNormalizer.DEFAULT_EXCLUSIONS))}}
+        for other in (TextNormalizer(), TextNormalizer(reordered)):
+            assert other._exclusion_re is normalizer._exclusion_re
+            assert other._COMPONENTS_RE is normalizer._COMPONENTS_RE
+
+    def test_normalize_many_matches_normalize(self, normalizer: TextNormalizer):
+        """Test batch normalization matches per-item normalization."""
+        texts = ["Dior Sauvage EDP spray", "Chanel Bleu EDT", "Dior Sauvage EDP spray"]
+        assert normalizer.normalize_many(texts) == [normalizer.normalize(t) for t in texts]
+
+    def test_extract_components_many_matches_extract_components(
+        self, normalizer: TextNormalizer
+    ):
+        """Test batch extraction matches per-item extraction."""
+        texts = ["Dior Sauvage EDP 100ml", "Chanel Bleu EDT 3.4 oz", "Dior Sauvage EDP 100ml"]
+        results = normalizer.extract_components_many(texts)
+        assert results == [normalizer.extract_components(t) for t in texts]
+        assert results[0] is not results[2]
+
+    def test_extract_components_returns_independent_copies(
+        self, normalizer: TextNormalizer
+    ):
+        """Test memoized extraction is not affected by callers mutating results."""
+        components = normalizer.extract_components("Dior Sauvage EDP 100ml")
+        components["concentration"] = "EDT"
+        assert normalizer.extract_components("Dior Sauvage EDP 100ml")["concentration"] == "EDP"
+
+    def test_analyze_skips_extraction_for_excluded_input(self, normalizer: TextNormalizer):
+        """Test analyze returns no components once an exclusion is found."""
+        analyzed = normalizer.analyze("Chanel Bleu EDP 5ml decant")
+        assert analyzed.exclusions == ("decant",)
+        assert analyzed.components == TextNormalizer._EMPTY_COMPONENTS
+        assert analyzed.components is not TextNormalizer._EMPTY_COMPONENTS
+        analyzed = normalizer.analyze("Chanel Bleu EDP Spray 100ml")
+        assert analyzed.lower == "chanel bleu edp spray 100ml"
+        assert analyzed.normalized == normalizer.normalize("Chanel Bleu EDP Spray 100ml")
+        assert analyzed.exclusions == ()
+        assert analyzed.components == normalizer.extract_components(analyzed.normalized)
+
+    def test_canonicalize(self, normalizer: TextNormalizer):
+        """Test long-form terms are replaced with canonical short forms."""
+        assert normalizer.canonicalize("Dior Sauvage Eau de  Parfum pour Homme") == (
+            "Dior Sauvage EDP for men"
+        )
+        assert normalizer.canonicalize("Chanel Eau de Toilettes") == "Chanel Eau de Toilettes"
+
     def test_find_exclusions(self, normalizer: TextNormalizer):
         """Test exclusion term detection."""
         exclusions = normalizer.find_exclusions("Chanel Bleu 5ml decant sample")
         assert "decant" in exclusions
         assert "sample" in exclusions
 
+    def test_find_exclusions_matches_whole_words(self, normalizer: TextNormalizer):
+        """Test exclusion terms match whole words, including plurals."""
+        assert normalizer.find_exclusions("Dior Sauvage administrator edition") == ()
+        assert normalizer.find_exclusions("Chanel Bleu 3 samples") == ("sample",)
+
+    def test_find_exclusions_matches_punctuated_terms(self):
+        """Test exclusion terms that start or end with punctuation still match."""
+        normalizer = TextNormalizer({"global": {"exclusions": ["(used)", "decant"]}})
+        assert normalizer.find_exclusions("Dior Sauvage EDP (used)") == ("(used)",)
+        assert normalizer.find_exclusions("Dior Sauvage EDP unused") == ()
+
     def test_extract_concentration_edp(self, normalizer: TextNormalizer):
         """Test EDP concentration extraction."""
         components = normalizer.extract_components("Dior Sauvage Eau de Parfum")
@@ -84,11 +189,27 @@ class TestTextNormalizer:
         components = normalizer.extract_components("Dior Sauvage EDP 3.4 oz")
         assert components["size_ml"] == 100  # 3.4 oz ≈ 100 ml
 
+    def test_extract_components_follows_pattern_priority(self, normalizer: TextNormalizer):
+        """Test earlier patterns win over earlier positions in the single scan."""
+        components = normalizer.extract_components("1 oz Bleu EDT and EDP set 30ml women men")
+        assert components["size_ml"] == 30
+        assert components["concentration"] == "EDP"
+        assert components["target"] == "men"
+
     def test_extract_year(self, normalizer: TextNormalizer):
         """Test year extraction."""
         components = normalizer.extract_components("Chanel No 5 Parfum 2020 edition")
         assert components["year"] == 2020
 
+    def test_extract_year_not_taken_from_size(self, normalizer: TextNormalizer):
+        """Test a number already matched as a size is not also read as a year."""
+        components = normalizer.extract_components("Creed Aventus 1990 ml")
+        assert components["size_ml"] == 1990
+        assert components["year"] is None
+        components = normalizer.extract_components("Creed Aventus 1990 100ml")
+        assert components["size_ml"] == 100
+        assert components["year"] == 1990
+
     def test_extract_target_men(self, normalizer: TextNormalizer):
         """Test target extraction for men."""
         components = normalizer.extract_components("Dior Sauvage pour homme")
@@ -104,6 +225,16 @@ class TestTextNormalizer:
         components = normalizer.extract_components("Dior Sauvage Intense")
         assert components["flanker"] == "Intense"
 
+    def test_extract_flanker_matches_whole_words(self, normalizer: TextNormalizer):
+        """Test flanker terms are not found inside other words."""
+        assert normalizer.extract_components("Ariana Grande Cloud EDP")["flanker"] is None
+        assert normalizer.extract_components("Tom Ford Oud Wood EDP")["flanker"] == "Oud"
+
+    def test_extract_flanker_prefers_longest_term(self, normalizer: TextNormalizer):
+        """Test that a flanker term is not shadowed by a shorter prefix term."""
+        components = normalizer.extract_components("Armani Code Absolute")
+        assert components["flanker"] == "Absolute"
+
     def test_build_search_query(self, normalizer: TextNormalizer):
         """Test search query building."""
         query = normalizer.build_search_query(
@@ -135,3 +266,8 @@ class TestParfumoUrlGeneration:
         """Test URL building handles spaces correctly."""
         url = mapper._build_parfumo_url("Tom Ford", "Oud Wood")
         assert url == "https://www.parfumo.com/Perfumes/Tom_Ford/Oud_Wood"
+
+    def test_build_parfumo_url_with_apostrophe(self, mapper: ParfumoMapper):
+        """Test URL building replaces apostrophes with underscores."""
+        url = mapper._build_parfumo_url("Yves Saint Laurent", "La Nuit de L'Homme")
+        assert url == "https://www.parfumo.com/Perfumes/Yves_Saint_Laurent/La_Nuit_de_L_Homme"
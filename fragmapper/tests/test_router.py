@@ -11,14 +11,16 @@ from fragmapper.router import FragMapperRouter
 from fragmapper.models.schemas import Mode, MatchStatus
 
 
+CONFIG_PATH = Path(__file__).parent.parent / "configs" / "fragmapper_rules.yml"
+
+
 class TestFragMapperRouter:
     """Test suite for FragMapperRouter."""
 
     @pytest.fixture
     def router(self) -> FragMapperRouter:
         """Create a router instance with test config."""
-        config_path = Path(__file__).parent.parent / "configs" / "fragmapper_rules.yml"
-        return FragMapperRouter(config_path=config_path)
+        return FragMapperRouter(config_path=CONFIG_PATH)
 
     def test_router_initialization(self, router: FragMapperRouter):
         """Test that router initializes correctly."""
@@ -26,6 +28,20 @@ class TestFragMapperRouter:
         assert router.config is not None
         assert len(router.supported_modes) == 3
 
+    def test_skills_are_initialized_on_first_route(self, router: FragMapperRouter):
+        """Test that a skill is only created when its mode is first routed."""
+        assert router._skills == {}
+        router.route(Mode.DESC_TO_PARFUMO_URL, "Dior Sauvage EDP")
+        assert list(router._skills) == [Mode.DESC_TO_PARFUMO_URL]
+
+    def test_config_is_not_shared_between_routers(self, router: FragMapperRouter):
+        """Test that mutating one router's config does not affect the next router."""
+        router.config["version"] = "mutated"
+        router.config.setdefault("global", {})["exclusions"] = []
+        other = FragMapperRouter(config_path=CONFIG_PATH)
+        assert other.config.get("version") != "mutated"
+        assert other.config.get("global", {}).get("exclusions") != []
+
     def test_supported_modes(self, router: FragMapperRouter):
         """Test that all expected modes are supported."""
         expected_modes = [
@@ -58,6 +74,15 @@ class TestFragMapperRouter:
         assert result.mode == Mode.PARFUMO_TO_FRAGRANTICA_URL
         assert result.status == MatchStatus.NO_MATCH  # Placeholder returns NOT_FOUND
 
+    def test_placeholder_results_are_not_shared(self, router: FragMapperRouter):
+        """Test that mutating one placeholder result does not leak into the next."""
+        first = router.route(Mode.DESC_TO_FRAGRANTICA_URL, "Dior Sauvage EDP")
+        first.debug.search_queries_used.append("leaked")
+        first.notes.append("leaked")
+        second = router.route(Mode.DESC_TO_FRAGRANTICA_URL, "Dior Sauvage EDP")
+        assert second.debug.search_queries_used == []
+        assert "leaked" not in second.notes
+
     def test_get_simple_output(self, router: FragMapperRouter):
         """Test simple string output generation."""
         output = router.get_simple_output(Mode.DESC_TO_FRAGRANTICA_URL, "Test input")
@@ -77,8 +102,7 @@ class TestRouterOutputContract:
     @pytest.fixture
     def router(self) -> FragMapperRouter:
         """Create a router instance."""
-        config_path = Path(__file__).parent.parent / "configs" / "fragmapper_rules.yml"
-        return FragMapperRouter(config_path=config_path)
+        return FragMapperRouter(config_path=CONFIG_PATH)
 
     def test_output_has_required_fields(self, router: FragMapperRouter):
         """Test that output contains all required fields."""
@@ -16,7 +16,10 @@ When to run:
     - README.md
 """
 
+import hashlib
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -47,32 +50,66 @@ ROOT_FILES = [
     "README.md",
 ]
 
+# Read size when fingerprinting file contents
+CHUNK_SIZE = 64 * 1024
+
+# Max number of files synced concurrently
+MAX_WORKERS = 8
+
 
 # ============================================================================
 # Sync Logic
 # ============================================================================
 
 
-def sync_file(source: Path, dest: Path) -> bool:
+def fingerprint(path: Path) -> bytes:
+    """Return a BLAKE2b digest of the file, read in chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def files_match(source: Path, dest: Path) -> bool:
+    """
+    Check whether dest already holds the same content as source.
+
+    sync_file carries the source mtime over, so a previously synced file
+    matches on size and mtime alone; contents are only fingerprinted when
+    the mtimes differ.
+    """
+    source_stat = source.stat()
+    dest_stat = dest.stat()
+    if source_stat.st_size != dest_stat.st_size:
+        return False
+    if source_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+        return True
+    return fingerprint(source) == fingerprint(dest)
+
+
+def sync_file(source: Path, dest: Path) -> tuple[bool, str]:
     """
     Copy source to dest if they differ or dest doesn't exist.
     
-    Returns True if a copy was made, False if already in sync.
+    Returns (copied, message): copied is True if a copy was made, False if
+    already in sync. The message is returned rather than printed so that
+    concurrent syncs can report in a stable order.
     """
     if not source.exists():
-        print(f"  ⚠ Source missing: {source.relative_to(PROJECT_ROOT)}")
-        return False
+        return False, f"  ⚠ Source missing: {source.relative_to(PROJECT_ROOT)}"
     
-    if dest.exists():
-        source_content = source.read_bytes()
-        dest_content = dest.read_bytes()
-        if source_content == dest_content:
-            print(f"  ✓ Already in sync: {dest.name}")
-            return False
+    if dest.exists() and files_match(source, dest):
+        return False, f"  ✓ Already in sync: {dest.name}"
     
-    shutil.copy2(source, dest)
-    print(f"  → Copied: {source.relative_to(PROJECT_ROOT)} → {dest.relative_to(PROJECT_ROOT)}")
-    return True
+    # Only content matters for the bundle, so skip copy2's permission and
+    # xattr copying; the mtime is still carried over for files_match
+    shutil.copyfile(source, dest)
+    source_stat = source.stat()
+    os.utime(dest, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+    source_name = source.relative_to(PROJECT_ROOT)
+    dest_name = dest.relative_to(PROJECT_ROOT)
+    return True, f"  → Copied: {source_name} → {dest_name}"
 
 
 def main():
@@ -84,31 +121,30 @@ def main():
     # Ensure project_files directory exists
     PROJECT_FILES_DIR.mkdir(exist_ok=True)
     
-    copied_count = 0
-    
-    # Sync docs
-    print("\nSyncing docs/*.md →")
-    for filename in DOCS_FILES:
-        source = DOCS_DIR / filename
-        dest = PROJECT_FILES_DIR / filename
-        if sync_file(source, dest):
-            copied_count += 1
+    # (heading, source directory, filenames) for each group of files
+    sections = [
+        ("Syncing docs/*.md →", DOCS_DIR, DOCS_FILES),
+        ("Syncing configs/*.yml →", CONFIGS_DIR, CONFIG_FILES),
+        ("Syncing root files →", PROJECT_ROOT, ROOT_FILES),
+    ]
+    pairs = [
+        (source_dir / filename, PROJECT_FILES_DIR / filename)
+        for _, source_dir, filenames in sections
+        for filename in filenames
+    ]
     
-    # Sync configs
-    print("\nSyncing configs/*.yml →")
-    for filename in CONFIG_FILES:
-        source = CONFIGS_DIR / filename
-        dest = PROJECT_FILES_DIR / filename
-        if sync_file(source, dest):
-            copied_count += 1
+    # Each sync is blocking file I/O, so overlap them on a small thread pool;
+    # map() yields results in input order, so output stays grouped
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(pairs))) as executor:
+        results = iter(executor.map(lambda pair: sync_file(*pair), pairs))
     
-    # Sync root files
-    print("\nSyncing root files →")
-    for filename in ROOT_FILES:
-        source = PROJECT_ROOT / filename
-        dest = PROJECT_FILES_DIR / filename
-        if sync_file(source, dest):
-            copied_count += 1
+    copied_count = 0
+    for heading, _, filenames in sections:
+        print(f"\n{heading}")
+        for _ in filenames:
+            copied, message = next(results)
+            print(message)
+            copied_count += copied
     
     # Summary
     print("\n" + "=" * 60)